@@ -1,12 +1,15 @@
 """Custom integration to integrate a Behringer mixer into Home Assistant."""
 from __future__ import annotations
 
+from pathlib import Path
+
+import orjson
 from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .api import BehringerMixerApiClient
-from .const import DOMAIN, LOGGER
+from .const import BUS, CHANNEL, DOMAIN, LOGGER
 from .coordinator import MixerDataUpdateCoordinator
 from .automation_recorder import AutomationRecorder
 from .automation_player import AutomationPlayer
@@ -112,56 +115,62 @@ class BehringerWingMixer:
     def __init__(self, ...):
         # ... existing code ...
         self.automation_recorder = AutomationRecorder()
-        self.automation_player = AutomationPlayer(self.osc_client)
-        self.armed_channels = set()  # Channels enabled for automation
+        self.automation_player = AutomationPlayer(self.hass, self.osc_client)
+        self.armed_channels: set[tuple[str, int]] = set()  # Channels enabled for automation
         
     async def async_setup_services(self):
         """Register automation services"""
-        
-        async def handle_record_start(call):
-            project_name = call.data.get("project_name")
-            initial_state = await self._capture_current_state()
-            self.automation_recorder.start_recording(initial_state)
-            
-        async def handle_record_stop(call):
-            save_path = call.data.get("save_path")
-            automation_data = self.automation_recorder.stop_recording()
-            await self._save_automation(save_path, automation_data)
-            
-        async def handle_play_automation(call):
-            automation_file = call.data.get("automation_file")
-            from_position = call.data.get("from_position", 0.0)
-            await self.automation_player.load_automation(automation_file)
-            await self.automation_player.start_playback(from_position)
-            
-        async def handle_stop_automation(call):
-            await self.automation_player.stop_playback()
-            
-        async def handle_arm_channels(call):
-            channels = self._parse_channel_list(call.data.get("channels", ""))
-            buses = self._parse_channel_list(call.data.get("buses", ""))
-            enable = call.data.get("enable", True)
-            
-            if enable:
-                self.armed_channels.update(channels)
-                self.armed_channels.update([(b, "bus") for b in buses])
-            else:
-                self.armed_channels.difference_update(channels)
-                self.armed_channels.difference_update([(b, "bus") for b in buses])
-        
-        # Register services
         self.hass.services.async_register(
-            DOMAIN, "record_automation_start", handle_record_start
+            DOMAIN, "record_automation_start", self._handle_record_start
         )
         self.hass.services.async_register(
-            DOMAIN, "record_automation_stop", handle_record_stop
+            DOMAIN, "record_automation_stop", self._handle_record_stop
         )
         self.hass.services.async_register(
-            DOMAIN, "play_automation", handle_play_automation
+            DOMAIN, "play_automation", self._handle_play_automation
         )
         self.hass.services.async_register(
-            DOMAIN, "stop_automation", handle_stop_automation
+            DOMAIN, "stop_automation", self._handle_stop_automation
         )
         self.hass.services.async_register(
-            DOMAIN, "automation_arm_channels", handle_arm_channels
+            DOMAIN, "automation_arm_channels", self._handle_arm_channels
         )
+
+    async def _handle_record_start(self, call):
+        project_name = call.data.get("project_name")
+        initial_state = await self._capture_current_state()
+        self.automation_recorder.start_recording(initial_state)
+
+    async def _handle_record_stop(self, call):
+        save_path = call.data.get("save_path")
+        automation_data = self.automation_recorder.stop_recording()
+        await self._save_automation(save_path, automation_data)
+
+    async def _save_automation(self, save_path, automation_data):
+        """Serialize automation data and write it without blocking the loop."""
+        data_bytes = orjson.dumps(automation_data)
+        await self.hass.async_add_executor_job(
+            Path(save_path).write_bytes, data_bytes
+        )
+
+    async def _handle_play_automation(self, call):
+        automation_file = call.data.get("automation_file")
+        from_position = call.data.get("from_position", 0.0)
+        await self.automation_player.load_automation(automation_file)
+        await self.automation_player.start_playback(from_position)
+
+    async def _handle_stop_automation(self, call):
+        await self.automation_player.stop_playback()
+
+    @callback
+    def _handle_arm_channels(self, call):
+        channels = self._parse_channel_list(call.data.get("channels", ""))
+        buses = self._parse_channel_list(call.data.get("buses", ""))
+        enable = call.data.get("enable", True)
+
+        # Every entry is a (kind, num) tuple, e.g. (CHANNEL, 1) or (BUS, 2)
+        keys = [(CHANNEL, c) for c in channels] + [(BUS, b) for b in buses]
+        if enable:
+            self.armed_channels.update(keys)
+        else:
+            self.armed_channels.difference_update(keys)
@@ -1,11 +1,135 @@
 import asyncio
+from bisect import bisect_left, bisect_right
+from contextlib import suppress
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Callable
 import json
+import os
+
+from .const import FADER, MUTE, PAN
+
+# OSC path suffix for each automated parameter
+_SUFFIX = {
+    FADER: "fdr",
+    MUTE: "mute",
+    PAN: "pan",
+}
+
+# Events closer together than this are sent from a single wakeup
+_GROUP_WINDOW = 0.001
+
+# Fader moves inside a window this long only keep their latest value
+_COALESCE_WINDOW = 0.005
+
+
+def _compile_events(events: list[dict]) -> list[dict]:
+    """Resolve the OSC path of every event, dropping unknown parameters"""
+    compiled = []
+    for e in events:
+        suffix = _SUFFIX.get(e["param_type"])
+        if suffix is None:
+            continue
+        e["_path"] = f"/{e['channel_type']}/{e['channel_num']}/{suffix}"
+        compiled.append(e)
+    return compiled
+
+
+def _compile_initial_state(
+    initial: dict,
+) -> list[tuple[str, int, str, float, str]]:
+    """Split initial state keys into (ctype, cnum, ptype, value, path) tuples"""
+    compiled = []
+    for key, value in initial.items():
+        # Parse key format: "ch_1_fader", "bus_2_mute", etc.
+        parts = key.split("_")
+        ctype, cnum, ptype = parts[0], int(parts[1]), parts[2]
+        suffix = _SUFFIX.get(ptype)
+        if suffix is None:
+            continue
+        compiled.append(
+            (ctype, cnum, ptype, value, f"/{ctype}/{cnum}/{suffix}")
+        )
+    return compiled
+
+
+def _coalesce_events(events: list[dict]) -> list[dict]:
+    """Drop fader events superseded by a later move within the same burst"""
+    coalesced = []
+    burst = []
+    for e in events:
+        if burst and e["timestamp"] - burst[0]["timestamp"] >= _COALESCE_WINDOW:
+            coalesced.extend(_coalesce_burst(burst))
+            burst = []
+        burst.append(e)
+    coalesced.extend(_coalesce_burst(burst))
+    return coalesced
+
+
+def _coalesce_burst(burst: list[dict]) -> list[dict]:
+    """Keep only the last fader event per path, mute and pan pass through"""
+    last = {
+        e["_path"]: i for i, e in enumerate(burst) if e["param_type"] == FADER
+    }
+    return [
+        e for i, e in enumerate(burst)
+        if e["param_type"] != FADER or last[e["_path"]] == i
+    ]
+
+
+def _group_events(
+    events: list[dict],
+) -> tuple[list[tuple[float, list[tuple[str, float]]]], list[int]]:
+    """Bundle near-simultaneous events into (timestamp, [(path, value)]) groups
+
+    Also returns the index of the first event in each group, so a position
+    in the event list can be mapped back to its group.
+    """
+    groups = []
+    group_first = []
+    for i, e in enumerate(events):
+        send = (e["_path"], e["value"])
+        if groups and e["timestamp"] - groups[-1][0] < _GROUP_WINDOW:
+            groups[-1][1].append(send)
+        else:
+            groups.append((e["timestamp"], [send]))
+            group_first.append(i)
+    return groups, group_first
+
+
+@lru_cache(maxsize=8)
+def _parse_automation(path: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """Parse an automation file, memoized on its path and stat signature
+
+    Only the compiled playback data is kept, and it is read-only because
+    the cached result is shared by every player that loads the file.
+    """
+    data = json.loads(Path(path).read_bytes())
+    events = _coalesce_events(_compile_events(data.get("events", [])))
+    groups, group_first = _group_events(events)
+    return MappingProxyType({
+        "groups": tuple((ts, tuple(sends)) for ts, sends in groups),
+        "group_first": tuple(group_first),
+        "timestamps": tuple(e["timestamp"] for e in events),
+        "initial_state": tuple(
+            _compile_initial_state(data.get("initial_state", {}))
+        ),
+    })
+
+
+def _load_and_parse(path: str) -> MappingProxyType:
+    """Load an automation file, reusing the parsed result if it is unchanged"""
+    stat = os.stat(path)
+    return _parse_automation(path, stat.st_mtime_ns, stat.st_size)
+
 
 class AutomationPlayer:
     """Plays back recorded mixer automation"""
     
-    def __init__(self, osc_client):
+    def __init__(self, hass, osc_client):
+        self.hass = hass
         self.osc_client = osc_client
         self.is_playing = False
         self.playback_task = None
@@ -14,14 +138,18 @@ class AutomationPlayer:
         
     async def load_automation(self, automation_file: str):
         """Load automation data from file"""
-        with open(automation_file, 'r') as f:
-            self.automation_data = json.load(f)
+        self.automation_data = await self.hass.async_add_executor_job(
+            _load_and_parse, automation_file
+        )
             
     async def start_playback(self, from_position: float = 0.0):
         """Start playing automation from specified position"""
         if not self.automation_data:
             raise ValueError("No automation data loaded")
             
+        # Only one playback runs at a time
+        await self.stop_playback()
+        
         self.is_playing = True
         self.current_position = from_position
         
@@ -39,62 +167,55 @@ class AutomationPlayer:
         self.is_playing = False
         if self.playback_task:
             self.playback_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.playback_task
+            self.playback_task = None
             
     async def _apply_initial_state(self):
         """Apply initial mixer state before playback"""
-        initial = self.automation_data.get("initial_state", {})
+        initial = self.automation_data["initial_state"]
         
-        for key, value in initial.items():
-            # Parse key format: "ch_1_fader", "bus_2_mute", etc.
-            parts = key.split("_")
-            channel_type = parts[0]
-            channel_num = int(parts[1])
-            param_type = parts[2]
-            
-            await self._send_osc_command(
-                channel_type, channel_num, param_type, value
-            )
+        # Sends are independent of each other, so issue them concurrently
+        await asyncio.gather(*(
+            self.osc_client.send_command(path, value)
+            for _, _, _, value, path in initial
+        ))
             
     async def _playback_loop(self):
         """Main playback loop that sends events at correct times"""
-        events = self.automation_data.get("events", [])
-        start_time = asyncio.get_event_loop().time()
-        
-        for event in events:
-            if not self.is_playing:
-                break
-                
-            # Skip events before current position
-            if event["timestamp"] < self.current_position:
-                continue
-                
-            # Calculate wait time
-            target_time = event["timestamp"] - self.current_position
-            current_elapsed = asyncio.get_event_loop().time() - start_time
-            wait_time = target_time - current_elapsed
-            
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        groups = self.automation_data["groups"]
+        loop = asyncio.get_running_loop()
+
+        # Anchor every event to an absolute deadline so scheduling jitter
+        # on one event does not carry over to the next
+        base = loop.time() - self.current_position
+        timestamps = self.automation_data["timestamps"]
+        start_idx = bisect_left(timestamps, self.current_position)
+        if start_idx == len(timestamps):
+            self.is_playing = False
+            return
+
+        # Resume partway through the group holding the first pending event
+        group_first = self.automation_data["group_first"]
+        group_idx = bisect_right(group_first, start_idx) - 1
+        first_sends = groups[group_idx][1][start_idx - group_first[group_idx]:]
+        schedule = chain(
+            ((timestamps[start_idx], first_sends),), groups[group_idx + 1:]
+        )
+
+        # stop_playback cancels this task, which surfaces from the sleep
+        try:
+            for timestamp, sends in schedule:
+                delay = (base + timestamp) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
                 
-            # Send OSC command
-            await self._send_osc_command(
-                event["channel_type"],
-                event["channel_num"],
-                event["param_type"],
-                event["value"]
-            )
+                # Send OSC commands
+                for path, value in sends:
+                    await self.osc_client.send_command(path, value)
             
-            self.current_position = event["timestamp"]
-            
-    async def _send_osc_command(self, channel_type: str, channel_num: int,
-                                param_type: str, value: float):
-        """Send OSC command to Wing mixer"""
-        osc_paths = {
-            "fader": f"/{channel_type}/{channel_num}/fdr",
-            "mute": f"/{channel_type}/{channel_num}/mute",
-            "pan": f"/{channel_type}/{channel_num}/pan"
-        }
-        
-        path = osc_paths.get(param_type)
-        if path:
-            await self.osc_client.send_command(path, value)
+                self.current_position = timestamp
+        except asyncio.CancelledError:
+            return
+        finally:
+            self.is_playing = False
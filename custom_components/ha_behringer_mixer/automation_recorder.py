@@ -1,35 +1,18 @@
-from datetime import datetime
+from array import array
 import json
+import time
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
-
-class AutomationEventType(Enum):
-    FADER = "fader"
-    MUTE = "mute"
-    PAN = "pan"
-
-class ChannelType(Enum):
-    CHANNEL = "ch"
-    BUS = "bus"
-    MAIN = "main"
-
-@dataclass
-class AutomationEvent:
-    timestamp: float  # Seconds since recording start
-    channel_type: str  # "ch", "bus", "main"
-    channel_num: int
-    param_type: str   # "fader", "mute", "pan"
-    value: float      # dB for fader, 0/1 for mute, -1 to 1 for pan
-    
-    def to_dict(self):
-        return asdict(self)
 
 class AutomationRecorder:
     """Records mixer parameter changes with timestamps"""
     
     def __init__(self):
-        self.events: List[AutomationEvent] = []
+        # Events are stored column-wise, one list per field
+        self._ts = array("d")
+        self._ctype: list[str] = []
+        self._cnum: list[int] = []
+        self._ptype: list[str] = []
+        self._val: list[float] = []
         self.is_recording = False
         self.start_time: Optional[float] = None
         self.initial_state: Dict = {}
@@ -37,8 +20,12 @@ class AutomationRecorder:
     def start_recording(self, initial_state: Dict):
         """Begin recording automation data"""
         self.is_recording = True
-        self.start_time = datetime.now().timestamp()
-        self.events = []
+        self.start_time = time.monotonic()
+        self._ts = array("d")
+        self._ctype = []
+        self._cnum = []
+        self._ptype = []
+        self._val = []
         self.initial_state = initial_state
         
     def stop_recording(self) -> Dict:
@@ -46,7 +33,18 @@ class AutomationRecorder:
         self.is_recording = False
         return {
             "initial_state": self.initial_state,
-            "events": [event.to_dict() for event in self.events],
+            "events": [
+                {
+                    "timestamp": ts,
+                    "channel_type": ctype,
+                    "channel_num": cnum,
+                    "param_type": ptype,
+                    "value": val,
+                }
+                for ts, ctype, cnum, ptype, val in zip(
+                    self._ts, self._ctype, self._cnum, self._ptype, self._val
+                )
+            ],
             "duration": self.get_elapsed_time()
         }
         
@@ -56,18 +54,14 @@ class AutomationRecorder:
         if not self.is_recording:
             return
             
-        timestamp = self.get_elapsed_time()
-        event = AutomationEvent(
-            timestamp=timestamp,
-            channel_type=channel_type,
-            channel_num=channel_num,
-            param_type=param_type,
-            value=value
-        )
-        self.events.append(event)
+        self._ts.append(self.get_elapsed_time())
+        self._ctype.append(channel_type)
+        self._cnum.append(channel_num)
+        self._ptype.append(param_type)
+        self._val.append(value)
         
     def get_elapsed_time(self) -> float:
         """Get time elapsed since recording started"""
         if self.start_time is None:
             return 0.0
-        return datetime.now().timestamp() - self.start_time
+        return time.monotonic() - self.start_time
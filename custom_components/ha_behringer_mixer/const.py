@@ -1,5 +1,6 @@
 """Constants for Behringer Wing Mixer integration."""
 from logging import Logger, getLogger
+from typing import Final
 
 LOGGER: Logger = getLogger(__package__)
 
@@ -8,3 +9,12 @@ DOMAIN = "ha_behringer_mixer_wing"
 VERSION = "0.1.1"
 ATTRIBUTION = ""
 MIXER_TYPES = ["WING"]  # Remove X32, M32, XR18, etc.
+
+# Automation channel types
+CHANNEL: Final = "ch"
+BUS: Final = "bus"
+
+# Automation parameter types
+FADER: Final = "fader"
+MUTE: Final = "mute"
+PAN: Final = "pan"
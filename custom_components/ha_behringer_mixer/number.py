@@ -6,7 +6,7 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 # from homeassistant.helpers import config_validation as cv, entity_platform
 # import voluptuous as vol
 
-from .const import DOMAIN
+from .const import CHANNEL, DOMAIN, FADER
 from .entity import BehringerMixerEntity
 
 
@@ -23,9 +23,9 @@ async def async_set_native_value(self, value: float) -> None:
     # Record automation if armed and recording
     if self._is_armed_for_automation():
         self.coordinator.automation_recorder.record_event(
-            channel_type="ch",
+            channel_type=CHANNEL,
             channel_num=self._channel_num,
-            param_type="fader",
+            param_type=FADER,
             value=value
         )
 
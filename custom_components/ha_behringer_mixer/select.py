@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 
-from .const import DOMAIN
+from .const import CHANNEL, DOMAIN, MUTE
 from .entity import BehringerMixerEntity
 
 
@@ -20,9 +20,9 @@ async def async_turn_on(self) -> None:
     
     if self._is_armed_for_automation():
         self.coordinator.automation_recorder.record_event(
-            channel_type="ch",
+            channel_type=CHANNEL,
             channel_num=self._channel_num,
-            param_type="mute",
+            param_type=MUTE,
             value=1.0
         )
 